@@ -1,27 +1,55 @@
 from __future__ import annotations
 
-import ast
+import functools
+import re
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation, getcontext
-from typing import List, Optional, Tuple
+from operator import methodcaller
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-getcontext().prec = 28
+_PRECISION = 28
+getcontext().prec = _PRECISION
+_INT_LIMIT = 10**_PRECISION
 
-OPERATORS = {"+", "-", "*", "/"}
+OPERATORS = frozenset({"+", "-", "*", "/"})
+
+_Number = Union[int, Decimal]
+
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_NEG_ONE = Decimal("-1")
+_HUNDRED = Decimal("100")
+
+_CANONICAL_NUMBER = re.compile(r"-?[1-9]\d*(\.\d*[1-9])?|-?0\.\d*[1-9]|0")
+
+_FMT_CACHE_SIZE = 1024
+_fmt_cache: Dict[Decimal, str] = {}
 
 
 def _format_decimal(value: Decimal) -> str:
+    if value.is_zero():
+        return "0"
+    integral = value.to_integral_value()
+    if integral == value and value.adjusted() < _PRECISION:
+        return format(integral, "f")
+    cached = _fmt_cache.get(value)
+    if cached is not None:
+        return cached
     text = format(value.normalize(), "f")
     if "." in text:
         text = text.rstrip("0").rstrip(".")
-    if text in {"", "-"}:
-        return "0"
-    if text == "-0":
-        return "0"
+    if text in {"", "-", "-0"}:
+        text = "0"
+    if len(_fmt_cache) >= _FMT_CACHE_SIZE:
+        _fmt_cache.clear()
+    _fmt_cache[value] = text
     return text
 
 
+@functools.lru_cache(maxsize=1024)
 def _sanitize_number(text: str) -> str:
+    if len(text) <= _PRECISION and _CANONICAL_NUMBER.fullmatch(text):
+        return text
     try:
         value = Decimal(text)
     except InvalidOperation as err:
@@ -29,60 +57,96 @@ def _sanitize_number(text: str) -> str:
     return _format_decimal(value)
 
 
-class _SafeEvaluator(ast.NodeVisitor):
-    def visit(self, node):
-        if isinstance(node, ast.Expression):
-            return self.visit(node.body)
-        if isinstance(node, ast.BinOp):
-            left = self.visit(node.left)
-            right = self.visit(node.right)
-            if isinstance(node.op, ast.Add):
-                return left + right
-            if isinstance(node.op, ast.Sub):
-                return left - right
-            if isinstance(node.op, ast.Mult):
-                return left * right
-            if isinstance(node.op, ast.Div):
-                if right == 0:
-                    raise ZeroDivisionError
-                return left / right
-            raise ValueError("未対応の演算子です")
-        if isinstance(node, ast.UnaryOp):
-            operand = self.visit(node.operand)
-            if isinstance(node.op, ast.UAdd):
-                return operand
-            if isinstance(node.op, ast.USub):
-                return -operand
-            raise ValueError("未対応の単項演算子です")
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, (int, float)):
-                return Decimal(str(node.value))
-            raise ValueError("未対応の定数が含まれています")
+def _apply_operation(left: _Number, operator: str, right: _Number) -> _Number:
+    if operator == "+":
+        return left + right
+    if operator == "-":
+        return left - right
+    if operator == "*":
+        return left * right
+    if right == 0:
+        raise ZeroDivisionError
+    return left / right
+
+
+def _parse_number(tokens: Tuple[str, ...], i: int, number: type) -> _Number:
+    if i >= len(tokens) or tokens[i] in OPERATORS:
         raise ValueError("不正な式が検出されました")
+    return number(tokens[i])
 
 
-def safe_calculate(expression: str) -> Decimal:
-    expression = expression.strip()
-    if not expression:
-        return Decimal("0")
-    tree = ast.parse(expression, mode="eval")
-    evaluator = _SafeEvaluator()
-    result = evaluator.visit(tree)
-    if not isinstance(result, Decimal):
+def _parse_term(tokens: Tuple[str, ...], i: int, number: type) -> Tuple[_Number, int]:
+    value = _parse_number(tokens, i, number)
+    i += 1
+    while i < len(tokens) and tokens[i] in {"*", "/"}:
+        operator = tokens[i]
+        right = _parse_number(tokens, i + 1, number)
+        i += 2
+        value = _apply_operation(value, operator, right)
+        if number is int and abs(value) >= _INT_LIMIT:
+            raise OverflowError
+    return value, i
+
+
+def _parse_expr(tokens: Tuple[str, ...], i: int, number: type) -> Tuple[_Number, int]:
+    value, i = _parse_term(tokens, i, number)
+    while i < len(tokens) and tokens[i] in {"+", "-"}:
+        operator = tokens[i]
+        right, i = _parse_term(tokens, i + 1, number)
+        value = _apply_operation(value, operator, right)
+        if number is int and abs(value) >= _INT_LIMIT:
+            raise OverflowError
+    return value, i
+
+
+def _is_integer_expression(tokens: Tuple[str, ...]) -> bool:
+    for token in tokens:
+        if token == "/":
+            return False
+        if token not in OPERATORS and not token.lstrip("-").isdigit():
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def safe_calculate(tokens: Tuple[str, ...]) -> Decimal:
+    if not tokens:
+        return _ZERO
+    if len(tokens) == 1:
+        return _parse_number(tokens, 0, Decimal)
+    number = int if _is_integer_expression(tokens) else Decimal
+    try:
+        result, i = _parse_expr(tokens, 0, number)
+    except OverflowError:
+        number = Decimal
+        result, i = _parse_expr(tokens, 0, number)
+    if i != len(tokens):
+        raise ValueError("不正な式が検出されました")
+    if number is int:
         return Decimal(result)
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorState:
     tokens: List[str] = field(default_factory=list)
     current: str = "0"
     overwrite: bool = True
     error: Optional[str] = None
+    current_decimal: Optional[Decimal] = None
+    acc: Optional[Decimal] = _ZERO
+    pending_add_op: str = "+"
+    pending_term: Decimal = _ONE
+    pending_mul_op: str = "*"
+    _expr_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def expression_text(self) -> str:
-        return " ".join(self.tokens)
+        if self._expr_cache is None:
+            self._expr_cache = " ".join(self.tokens)
+        return self._expr_cache
 
 
 class CalculatorEngine:
@@ -90,30 +154,14 @@ class CalculatorEngine:
         self.state = CalculatorState()
 
     def process(self, command: str) -> Tuple[str, str, Optional[str]]:
-        dispatcher = {
-            "C": self._clear_all,
-            "CE": self._clear_entry,
-            "=": self._calculate_result,
-            "%": self._percent,
-            "+/-": self._toggle_sign,
-            "±": self._toggle_sign,
-            "⌫": self._backspace,
-            "Backspace": self._backspace,
-        }
-        if command in "0123456789":
-            self._input_digit(command)
-        elif command == ".":
-            self._input_decimal_point()
-        elif command in OPERATORS:
-            self._apply_operator(command)
-        elif command in dispatcher:
-            dispatcher[command]()
-        else:
-            return self.get_display()
+        handler = self._DISPATCH.get(command)
+        if handler is not None:
+            handler(self)
         return self.get_display()
 
     def get_display(self) -> Tuple[str, str, Optional[str]]:
-        return self.state.expression_text, self.state.current, self.state.error
+        state = self.state
+        return state.expression_text, state.current, state.error
 
     def _reset_on_error(self) -> None:
         if self.state.error:
@@ -121,17 +169,20 @@ class CalculatorEngine:
 
     def _input_digit(self, digit: str) -> None:
         self._reset_on_error()
-        if self.state.overwrite:
-            self.state.current = digit
-            self.state.overwrite = False
+        state = self.state
+        state.current_decimal = None
+        if state.overwrite:
+            state.current = digit
+            state.overwrite = False
             return
-        if self.state.current == "0":
-            self.state.current = digit
+        if state.current == "0":
+            state.current = digit
         else:
-            self.state.current += digit
+            state.current += digit
 
     def _input_decimal_point(self) -> None:
         self._reset_on_error()
+        self.state.current_decimal = None
         if self.state.overwrite:
             self.state.current = "0."
             self.state.overwrite = False
@@ -144,17 +195,59 @@ class CalculatorEngine:
         self._commit_current()
         if self.state.tokens and self.state.tokens[-1] in OPERATORS:
             self.state.tokens[-1] = operator
+            self.state.acc = None
         else:
             self.state.tokens.append(operator)
+            self._fold_operand(Decimal(self.state.tokens[-2]), operator)
+        self.state._expr_cache = None
         self.state.overwrite = True
 
+    def _current_value(self) -> Decimal:
+        state = self.state
+        if state.current_decimal is None:
+            state.current_decimal = Decimal(state.current)
+        return state.current_decimal
+
+    def _fold_operand(self, operand: Decimal, operator: str) -> None:
+        state = self.state
+        if state.acc is None:
+            return
+        try:
+            term = _apply_operation(state.pending_term, state.pending_mul_op, operand)
+        except ZeroDivisionError:
+            state.acc = None
+            return
+        if operator in {"*", "/"}:
+            state.pending_term = term
+            state.pending_mul_op = operator
+            return
+        state.acc = _apply_operation(state.acc, state.pending_add_op, term)
+        state.pending_add_op = operator
+        state.pending_term = _ONE
+        state.pending_mul_op = "*"
+
+    def _fold_result(self, operand: Decimal) -> Decimal:
+        state = self.state
+        term = _apply_operation(state.pending_term, state.pending_mul_op, operand)
+        return _apply_operation(state.acc, state.pending_add_op, term)
+
+    def _clear_expression(self) -> None:
+        self.state.tokens.clear()
+        self.state._expr_cache = None
+        self.state.acc = _ZERO
+        self.state.pending_add_op = "+"
+        self.state.pending_term = _ONE
+        self.state.pending_mul_op = "*"
+
     def _commit_current(self) -> None:
         value = _sanitize_number(self.state.current)
+        self.state._expr_cache = None
         if self.state.tokens:
             if self.state.tokens[-1] in OPERATORS:
                 self.state.tokens.append(value)
             else:
                 self.state.tokens[-1] = value
+                self.state.acc = None
         else:
             self.state.tokens.append(value)
 
@@ -182,9 +275,14 @@ class CalculatorEngine:
                 tokens[-1] = current_value
         elif tokens and tokens[-1] in OPERATORS:
             tokens.pop()
-        expression = " ".join(tokens)
+        # 逐次計算できない場合（途中のゼロ除算など）のみ safe_calculate で
+        # 再評価する。将来の括弧入力対応に備えた汎用評価器としても残している。
+        foldable = self.state.acc is not None and self.state.tokens[-1] in OPERATORS
         try:
-            result_decimal = safe_calculate(expression)
+            if foldable:
+                result_decimal = self._fold_result(Decimal(tokens[-1]))
+            else:
+                result_decimal = safe_calculate(tuple(tokens))
         except ZeroDivisionError:
             self._set_error("ゼロ除算エラー")
             return
@@ -192,7 +290,8 @@ class CalculatorEngine:
             self._set_error("式の解析に失敗しました")
             return
         self.state.current = _format_decimal(result_decimal)
-        self.state.tokens.clear()
+        self.state.current_decimal = result_decimal
+        self._clear_expression()
         self.state.overwrite = True
         self.state.error = None
 
@@ -202,22 +301,24 @@ class CalculatorEngine:
     def _clear_entry(self) -> None:
         self._reset_on_error()
         self.state.current = "0"
+        self.state.current_decimal = _ZERO
         self.state.overwrite = True
 
     def _toggle_sign(self) -> None:
         self._reset_on_error()
         try:
-            value = Decimal(self.state.current) * Decimal("-1")
+            value = self._current_value() * _NEG_ONE
         except InvalidOperation:
             self._set_error("数値の解析に失敗しました")
             return
         self.state.current = _format_decimal(value)
+        self.state.current_decimal = value
         self.state.overwrite = False
 
     def _percent(self) -> None:
         self._reset_on_error()
         try:
-            current_value = Decimal(self.state.current)
+            current_value = self._current_value()
         except InvalidOperation:
             self._set_error("数値の解析に失敗しました")
             return
@@ -225,15 +326,17 @@ class CalculatorEngine:
             try:
                 base = Decimal(self.state.tokens[-2])
             except InvalidOperation:
-                base = Decimal("0")
-            current_value = base * current_value / Decimal("100")
+                base = _ZERO
+            current_value = base * current_value / _HUNDRED
         else:
-            current_value = current_value / Decimal("100")
+            current_value = current_value / _HUNDRED
         self.state.current = _format_decimal(current_value)
+        self.state.current_decimal = current_value
         self.state.overwrite = False
 
     def _backspace(self) -> None:
         self._reset_on_error()
+        self.state.current_decimal = None
         if self.state.overwrite:
             self.state.current = "0"
             return
@@ -248,6 +351,21 @@ class CalculatorEngine:
 
     def _set_error(self, message: str) -> None:
         self.state.error = message
-        self.state.tokens.clear()
+        self._clear_expression()
         self.state.current = "0"
+        self.state.current_decimal = _ZERO
         self.state.overwrite = True
+
+    _DISPATCH: Dict[str, Callable[[CalculatorEngine], None]] = {
+        **{digit: methodcaller("_input_digit", digit) for digit in "0123456789"},
+        **{op: methodcaller("_apply_operator", op) for op in OPERATORS},
+        ".": _input_decimal_point,
+        "C": _clear_all,
+        "CE": _clear_entry,
+        "=": _calculate_result,
+        "%": _percent,
+        "+/-": _toggle_sign,
+        "±": _toggle_sign,
+        "⌫": _backspace,
+        "Backspace": _backspace,
+    }
@@ -1,50 +1,58 @@
 from __future__ import annotations
 
+import functools
+import sys
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 from .logic import CalculatorEngine
 
 BUTTON_LAYOUT = [
-    ["CE", "C", "⌫", "%"],
-    ["7", "8", "9", "÷"],
-    ["4", "5", "6", "×"],
-    ["1", "2", "3", "-"],
-    ["±", "0", ".", "+"],
+    [sys.intern(label) for label in row]
+    for row in (
+        ("CE", "C", "⌫", "%"),
+        ("7", "8", "9", "÷"),
+        ("4", "5", "6", "×"),
+        ("1", "2", "3", "-"),
+        ("±", "0", ".", "+"),
+    )
 ]
 
-COMMAND_MAP: Dict[str, str] = {
-    "÷": "/",
-    "×": "*",
-}
-
-KEY_COMMANDS: Dict[str, str] = {
-    "Return": "=",
-    "KP_Enter": "=",
-    "plus": "+",
-    "KP_Add": "+",
-    "minus": "-",
-    "KP_Subtract": "-",
-    "asterisk": "*",
-    "KP_Multiply": "*",
-    "slash": "/",
-    "KP_Divide": "/",
-    "BackSpace": "⌫",
-    "Delete": "CE",
-    "Escape": "C",
-    "F9": "±",
-    "percent": "%",
-}
+_TRANS = str.maketrans({"÷": "/", "×": "*"})
+
+KEY_COMMANDS: Mapping[str, str] = MappingProxyType(
+    {
+        "Return": "=",
+        "KP_Enter": "=",
+        "plus": "+",
+        "KP_Add": "+",
+        "minus": "-",
+        "KP_Subtract": "-",
+        "asterisk": "*",
+        "KP_Multiply": "*",
+        "slash": "/",
+        "KP_Divide": "/",
+        "BackSpace": "⌫",
+        "Delete": "CE",
+        "Escape": "C",
+        "F9": "±",
+        "percent": "%",
+    }
+)
 
 
 class CalculatorUI:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.engine = CalculatorEngine()
-        self.expression_var = tk.StringVar()
-        self.display_var = tk.StringVar(value="0")
-        self.status_var = tk.StringVar()
+        self._cmd_cache: Dict[str, Callable[[], None]] = {
+            label: functools.partial(self._handle_command, label)
+            for row in BUTTON_LAYOUT
+            for label in row
+        }
+        self._cmd_cache["="] = functools.partial(self._handle_command, "=")
 
         self._configure_root()
         self._build_layout()
@@ -66,7 +74,6 @@ class CalculatorUI:
 
         self.expression_label = ttk.Label(
             container,
-            textvariable=self.expression_var,
             anchor="e",
             font=("Segoe UI", 12),
             foreground="#555555",
@@ -75,7 +82,7 @@ class CalculatorUI:
 
         self.display_label = tk.Label(
             container,
-            textvariable=self.display_var,
+            text="0",
             anchor="e",
             font=("Segoe UI", 28, "bold"),
             bg="#ffffff",
@@ -88,7 +95,6 @@ class CalculatorUI:
 
         self.status_label = ttk.Label(
             container,
-            textvariable=self.status_var,
             anchor="e",
             font=("Segoe UI", 10),
             foreground="#c53030",
@@ -109,7 +115,7 @@ class CalculatorUI:
         equal_button = ttk.Button(
             button_frame,
             text="=",
-            command=lambda: self._handle_command("="),
+            command=self._cmd_cache["="],
             style="Accent.TButton",
         )
         equal_button.grid(
@@ -122,7 +128,7 @@ class CalculatorUI:
         button = ttk.Button(
             parent,
             text=label,
-            command=lambda lbl=label: self._handle_command(lbl),
+            command=self._cmd_cache[label],
         )
         button.grid(row=row, column=column, sticky="nsew", padx=2, pady=2)
 
@@ -144,21 +150,16 @@ class CalculatorUI:
             self._handle_command(command)
 
     def _handle_command(self, label: str) -> None:
-        command = COMMAND_MAP.get(label, label)
+        command = label.translate(_TRANS)
         expression, current, error = self.engine.process(command)
         self._update_display(expression, current, error)
 
     def _update_display(
         self, expression: str, current: str, error: Optional[str]
     ) -> None:
-        self.expression_var.set(expression)
-        self.display_var.set(current)
-        if error:
-            self.status_var.set(error)
-            self.display_label.configure(fg="#c53030")
-        else:
-            self.status_var.set("")
-            self.display_label.configure(fg="#202020")
+        self.expression_label.configure(text=expression)
+        self.display_label.configure(text=current, fg="#c53030" if error else "#202020")
+        self.status_label.configure(text=error or "")
 
 
 def launch() -> None:
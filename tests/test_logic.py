@@ -1,4 +1,16 @@
-from calc.logic import CalculatorEngine
+from decimal import Decimal
+
+import pytest
+
+from calc.logic import (
+    _FMT_CACHE_SIZE,
+    CalculatorEngine,
+    _fmt_cache,
+    _format_decimal,
+    _is_integer_expression,
+    _sanitize_number,
+    safe_calculate,
+)
 
 
 def press(engine: CalculatorEngine, sequence: str) -> CalculatorEngine:
@@ -41,3 +53,160 @@ def test_divide_by_zero_error() -> None:
     assert error == "ゼロ除算エラー"
     assert current == "0"
     assert expression == ""
+
+
+def test_operator_precedence() -> None:
+    engine = CalculatorEngine()
+    press(engine, "2+3*4-6/2=")
+    assert engine.state.current == "11"
+
+
+def test_safe_calculate_rejects_dangling_operator() -> None:
+    with pytest.raises(ValueError):
+        safe_calculate(("1", "+"))
+
+
+def test_decimal_addition_is_exact() -> None:
+    engine = CalculatorEngine()
+    press(engine, "0.1+0.2=")
+    assert engine.state.current == "0.3"
+
+
+def test_integer_expression() -> None:
+    tokens = ("123456789", "*", "1000", "-", "9")
+    assert _is_integer_expression(tokens)
+    assert safe_calculate(tokens) == Decimal("123456788991")
+
+
+def test_wide_integer_expression_rounds_like_decimal() -> None:
+    a = "10000000000000000000001"
+    b = "10000000000000000000000"
+    tokens = (a, "*", a, "-", b, "*", b)
+    expected = Decimal("20000000000000000000000")
+    assert safe_calculate(tokens) == expected
+    assert safe_calculate((*tokens, "/", "1")) == expected
+
+
+def test_fractional_literal_falls_back_to_decimal() -> None:
+    tokens = ("1.5", "*", "3", "+", "0.1")
+    assert not _is_integer_expression(tokens)
+    assert safe_calculate(tokens) == Decimal("4.6")
+
+
+def test_division_falls_back_to_decimal() -> None:
+    tokens = ("1", "/", "3")
+    assert not _is_integer_expression(tokens)
+    assert safe_calculate(tokens) == Decimal(1) / Decimal(3)
+
+
+def test_divide_by_zero_mid_expression() -> None:
+    engine = CalculatorEngine()
+    press(engine, "8/0+1=")
+    assert engine.state.error == "ゼロ除算エラー"
+
+
+def test_expression_text_tracks_tokens() -> None:
+    engine = CalculatorEngine()
+    press(engine, "12+")
+    assert engine.get_display()[0] == "12 +"
+    press(engine, "3*")
+    assert engine.get_display()[0] == "12 + 3 *"
+    engine.process("=")
+    assert engine.get_display()[0] == ""
+
+
+def test_long_entry_folds_sanitized_value() -> None:
+    engine = CalculatorEngine()
+    press(engine, "0.33333333333333333333333333332/=")
+    assert engine.get_display() == ("", "1", None)
+
+
+def test_toggle_sign_result_then_divide() -> None:
+    engine = CalculatorEngine()
+    press(engine, "3/9=")
+    engine.process("±")
+    press(engine, "2/=")
+    assert engine.state.current == "1"
+
+
+def test_percent_reuses_current_value() -> None:
+    engine = CalculatorEngine()
+    press(engine, "50")
+    engine.process("%")
+    engine.process("±")
+    assert engine.state.current == "-0.5"
+    press(engine, "*4=")
+    assert engine.state.current == "-2"
+
+
+def test_safe_calculate_precedence() -> None:
+    tokens = ("2", "+", "3", "*", "4", "-", "6", "/", "2")
+    assert safe_calculate(tokens) == Decimal("11")
+
+
+def test_safe_calculate_divide_by_zero() -> None:
+    with pytest.raises(ZeroDivisionError):
+        safe_calculate(("1", "+", "8", "/", "0"))
+
+
+@pytest.mark.parametrize(
+    "sequence",
+    [
+        "1+2*3-4/5",
+        "7/3*3-1",
+        "10-2-3*4/6+0.5",
+        "1/3+1/3+1/3",
+        "9*9/7-8+6/4*2",
+        "0.1*0.2-0.3/7",
+        "10000000000000000000001*10000000000000000000001"
+        "-10000000000000000000000*10000000000000000000000",
+    ],
+)
+def test_running_result_matches_safe_calculate(sequence: str) -> None:
+    engine = CalculatorEngine()
+    press(engine, sequence)
+    tokens = (*engine.state.tokens, engine.state.current)
+    expected = _format_decimal(safe_calculate(tokens))
+    before = safe_calculate.cache_info()
+    engine.process("=")
+    assert safe_calculate.cache_info() == before
+    assert engine.state.current == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("-0.0", "0"),
+        ("100.000", "100"),
+        ("1E+3", "1000"),
+        ("12345678901234567890123456789", "12345678901234567890123456790"),
+        ("2.50", "2.5"),
+    ],
+)
+def test_format_decimal(value: str, expected: str) -> None:
+    assert _format_decimal(Decimal(value)) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("5.", "5"),
+        ("0.50", "0.5"),
+        ("-0", "0"),
+        ("007", "7"),
+        ("-12.5", "-12.5"),
+    ],
+)
+def test_sanitize_number(text: str, expected: str) -> None:
+    assert _sanitize_number(text) == expected
+
+
+def test_format_cache_is_reused_and_bounded() -> None:
+    _fmt_cache.clear()
+    assert _format_decimal(Decimal("2.50")) == "2.5"
+    assert _fmt_cache == {Decimal("2.5"): "2.5"}
+    assert _format_decimal(Decimal("2.5000")) == "2.5"
+    assert len(_fmt_cache) == 1
+    for n in range(_FMT_CACHE_SIZE + 10):
+        _format_decimal(Decimal(n) / 8 + Decimal("0.001"))
+    assert len(_fmt_cache) <= _FMT_CACHE_SIZE